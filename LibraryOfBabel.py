@@ -1,21 +1,59 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
 from tkinter.scrolledtext import ScrolledText
+import functools
 import hashlib
 import random
 import string
 import time
 import re
+import threading
+from collections import OrderedDict, namedtuple
+
+
+# Byte -> base-36 character table used when building hex names
+_HEX36 = b"0123456789abcdefghijklmnopqrstuvwxyz"
+_HEX36_TABLE = bytes(_HEX36[b % 36] for b in range(256))
+
+# Compact, immutable record for a single search hit
+SearchResult = namedtuple(
+    'SearchResult',
+    'address content search_text original_query position type variation description similarity_type',
+    defaults=(None,)
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _derive_cached(seed, base_input, variant, hex_length):
+    """Memoized hex name and coordinate bytes keyed on seed, input and variant"""
+    combined_input = seed + str(base_input) + str(variant)
+
+    # One SHAKE-128 call yields the hex name bytes followed by 8 coordinate bytes;
+    # translate maps each name byte to base 36
+    digest = hashlib.shake_128(combined_input.encode()).digest(hex_length + 8)
+    return digest[:hex_length].translate(_HEX36_TABLE).decode('ascii'), digest[hex_length:]
 
 
 class LibraryOfBabel:
-    def __init__(self):
+    def __init__(self, max_cache_size=2048):
         # Character set: 26 lowercase letters + space + comma + period
         self.CHARSET = string.ascii_lowercase + ' ,.'
         self.BASE = len(self.CHARSET)  # 29
         self.PAGE_LENGTH = 1000
         self.HEX_LENGTH = 120
 
+        # Byte -> character table for page generation; bytes above the largest
+        # multiple of BASE are rejected so every character is equally likely
+        charset_bytes = self.CHARSET.encode('ascii')
+        self._CHARSET_TABLE = bytes(charset_bytes[b % self.BASE] for b in range(256))
+        self._REJECT_BYTES = bytes(range(256 - 256 % self.BASE, 256))
+
+        # Character -> number lookup for char_to_num
+        self._CHAR_TO_NUM = {c: i for i, c in enumerate(self.CHARSET)}
+
+        # Delete set of every 8-bit character outside CHARSET, for bytes.translate
+        self._INVALID_BYTES = bytes(i for i in range(256) if chr(i) not in self.CHARSET)
+
         # Default constant seed value (example)
         self.CONSTANT_SEED = "8e447372cbc75ffc238749baf6eccbec586104336af37347606d14c698eaec1f"
 
@@ -25,73 +63,67 @@ class LibraryOfBabel:
         self.VOLUMES_PER_SHELF = 32
         self.PAGES_PER_VOLUME = 410
 
-        # Global cache to ensure consistency
-        self._address_cache = {}
-        self._content_cache = {}
+        # Address format: <hex name>-w<wall>-s<shelf>-v<volume>:<page>
+        self._ADDR_RE = re.compile(r'([^-]+)-w(\d+)-s(\d+)-v(\d+):(\d+)')
+
+        # Global caches to ensure consistency, bounded with LRU eviction; the lock
+        # lets searches run on a worker thread while the GUI keeps browsing
+        self.max_cache_size = max_cache_size
+        self._cache_lock = threading.RLock()
+        self._address_cache = OrderedDict()
+        self._content_cache = OrderedDict()
 
     def set_seed(self, new_seed):
         """Allow manual override of the constant seed"""
         self.CONSTANT_SEED = new_seed
-        self._address_cache = {}
-        self._content_cache = {}
+        _derive_cached.cache_clear()
+        with self._cache_lock:
+            self._address_cache.clear()
+            self._content_cache.clear()
 
     def char_to_num(self, char):
         """Convert character to number (0-28)"""
-        if char in self.CHARSET:
-            return self.CHARSET.index(char)
-        return 0
+        return self._CHAR_TO_NUM.get(char, 0)
 
     def num_to_char(self, num):
         """Convert number to character"""
         return self.CHARSET[num % self.BASE]
 
+    def _clean_text(self, text):
+        """Lowercase text and drop every character outside CHARSET"""
+        # Characters beyond latin-1 are never in CHARSET, so they are dropped by the
+        # encode; bytes.translate then deletes the rest in a single C pass
+        return text.lower().encode('latin-1', 'ignore').translate(None, self._INVALID_BYTES).decode('latin-1')
+
     def _generate_hex_name(self, base_input, variant=0):
         """Generate a consistent hex name of exactly 120 characters"""
-        combined_input = self.CONSTANT_SEED + str(base_input) + str(variant)
-        hex_chars = "0123456789abcdefghijklmnopqrstuvwxyz"
-        hex_name = ""
-
-        current_hash = hashlib.sha256(combined_input.encode()).hexdigest()
-
-        while len(hex_name) < self.HEX_LENGTH:
-            for char in current_hash:
-                if len(hex_name) >= self.HEX_LENGTH:
-                    break
-                hex_name += hex_chars[int(char, 16) % 36]
-
-            if len(hex_name) < self.HEX_LENGTH:
-                current_hash = hashlib.sha256((current_hash + combined_input).encode()).hexdigest()
+        return self._derive(base_input, variant)[0]
 
-        return hex_name[:self.HEX_LENGTH]
+    def _derive(self, base_input, variant=0):
+        """Return (hex_name, coord_bytes) derived from a single hash call"""
+        return _derive_cached(self.CONSTANT_SEED, base_input, variant, self.HEX_LENGTH)
 
-    def _create_exact_match_variations(self, text, num_variants=3):
+    def _create_exact_match_variations(self, clean_text, num_variants=3):
         """Create exact match variations with different space padding patterns"""
-        clean_text = ''.join(c for c in text.lower() if c in self.CHARSET)
-        variations = []
-
-        for i in range(num_variants):
-            # Create exact match with spaces filling the rest
-            if len(clean_text) < self.PAGE_LENGTH:
-                exact_content = clean_text + ' ' * (self.PAGE_LENGTH - len(clean_text))
-            else:
-                exact_content = clean_text[:self.PAGE_LENGTH]
-
-            variations.append({
-                'text': exact_content,
-                'original': clean_text,
-                'type': 'exact',
-                'description': f'Exact match {i + 1} - full text with space padding'
-            })
-
-        return variations
-
-    def _create_similar_match_variations(self, text, num_variants=5):
+        # The padded page does not depend on the variant, so every entry shares one string
+        exact_content = clean_text.ljust(self.PAGE_LENGTH)[:self.PAGE_LENGTH]
+
+        return [{
+            'text': exact_content,
+            'original': clean_text,
+            'position': 0,
+            'type': 'exact',
+            'description': f'Exact match {i + 1} - full text with space padding'
+        } for i in range(num_variants)]
+
+    def _create_similar_match_variations(self, clean_text, num_variants=5):
         """Create similar matches: exact text with end spaces or as substring"""
-        clean_text = ''.join(c for c in text.lower() if c in self.CHARSET)
         variations = []
 
-        # Set deterministic seed for consistent similar variations
-        random.seed(hash(text + self.CONSTANT_SEED) % (2 ** 32))
+        # Local deterministic RNG for consistent similar variations; seeded from a digest
+        # because the built-in hash() of a str is salted per process
+        seed_digest = hashlib.sha256((clean_text + self.CONSTANT_SEED).encode()).digest()
+        rng = random.Random(int.from_bytes(seed_digest[:4], 'big'))
 
         for i in range(num_variants):
             if i < 2:
@@ -99,21 +131,17 @@ class LibraryOfBabel:
                 if i == 0:
                     # Spaces at the end
                     spaces_before = 0
-                    spaces_after = min(10, self.PAGE_LENGTH - len(clean_text))
                 else:
                     # Spaces at the beginning
                     spaces_before = min(5, self.PAGE_LENGTH - len(clean_text))
-                    spaces_after = min(5, self.PAGE_LENGTH - len(clean_text) - spaces_before)
 
-                content = ' ' * spaces_before + clean_text + ' ' * spaces_after
-                if len(content) < self.PAGE_LENGTH:
-                    content += ' ' * (self.PAGE_LENGTH - len(content))
-                else:
-                    content = content[:self.PAGE_LENGTH]
+                # ljust pads the rest of the page with spaces in one C-level call
+                content = (' ' * spaces_before + clean_text).ljust(self.PAGE_LENGTH)[:self.PAGE_LENGTH]
 
                 variations.append({
                     'text': content,
                     'original': clean_text,
+                    'position': spaces_before,
                     'type': 'similar_spaces',
                     'description': f'Exact text with additional spaces (variation {i + 1})'
                 })
@@ -121,22 +149,19 @@ class LibraryOfBabel:
             else:
                 # Type 2: Exact text as substring within longer coherent text
                 # Generate prefix and suffix using deterministic method
-                prefix_length = random.randint(10, min(100, (self.PAGE_LENGTH - len(clean_text)) // 2))
+                prefix_length = rng.randint(10, min(100, (self.PAGE_LENGTH - len(clean_text)) // 2))
                 suffix_length = self.PAGE_LENGTH - len(clean_text) - prefix_length
 
                 # Generate meaningful-looking prefix and suffix
                 prefix = self._generate_coherent_text(prefix_length, i)
                 suffix = self._generate_coherent_text(suffix_length, i + 100)
 
-                content = prefix + clean_text + suffix
-                if len(content) > self.PAGE_LENGTH:
-                    content = content[:self.PAGE_LENGTH]
-                elif len(content) < self.PAGE_LENGTH:
-                    content += ' ' * (self.PAGE_LENGTH - len(content))
+                content = (prefix + clean_text + suffix).ljust(self.PAGE_LENGTH)[:self.PAGE_LENGTH]
 
                 variations.append({
                     'text': content,
                     'original': clean_text,
+                    'position': prefix_length,
                     'type': 'similar_substring',
                     'description': f'Exact text as substring within longer text (variation {i - 1})'
                 })
@@ -156,47 +181,42 @@ class LibraryOfBabel:
             "a journey of a thousand miles begins with a single step"
         ]
 
-        random.seed(hash(str(seed_modifier) + self.CONSTANT_SEED) % (2 ** 32))
-        pattern = random.choice(common_patterns)
+        seed_digest = hashlib.sha256((str(seed_modifier) + self.CONSTANT_SEED).encode()).digest()
+        rng = random.Random(int.from_bytes(seed_digest[:4], 'big'))
+        pattern = rng.choice(common_patterns)
 
-        # Repeat and modify pattern to reach desired length
-        text = ""
-        while len(text) < length:
-            remaining = length - len(text)
-            if remaining >= len(pattern):
-                text += pattern + " "
-            else:
-                text += pattern[:remaining]
+        # Repeat pattern to reach desired length in a single allocation
+        reps = length // (len(pattern) + 1) + 1
+        text = ((pattern + " ") * reps)[:length]
 
         # Clean and ensure only valid characters
-        clean_text = ''.join(c for c in text.lower() if c in self.CHARSET)
+        clean_text = self._clean_text(text)
         return clean_text[:length]
 
     def _create_deterministic_address(self, text_input, location_variant=0):
         """Create a deterministic address for consistent results"""
-        hex_name = self._generate_hex_name(text_input, location_variant)
+        hex_name, coord_bytes = self._derive(text_input, location_variant)
 
-        coord_seed = self.CONSTANT_SEED + hex_name + str(location_variant)
-        coord_hash = hashlib.sha256(coord_seed.encode()).hexdigest()
-
-        wall = (int(coord_hash[0:4], 16) % self.WALLS_PER_HEX) + 1
-        shelf = (int(coord_hash[4:8], 16) % self.SHELVES_PER_WALL) + 1
-        volume = (int(coord_hash[8:12], 16) % self.VOLUMES_PER_SHELF) + 1
-        page = (int(coord_hash[12:16], 16) % self.PAGES_PER_VOLUME) + 1
+        # Two bytes per coordinate, taken from the same digest as the hex name
+        wall = (int.from_bytes(coord_bytes[0:2], 'big') % self.WALLS_PER_HEX) + 1
+        shelf = (int.from_bytes(coord_bytes[2:4], 'big') % self.SHELVES_PER_WALL) + 1
+        volume = (int.from_bytes(coord_bytes[4:6], 'big') % self.VOLUMES_PER_SHELF) + 1
+        page = (int.from_bytes(coord_bytes[6:8], 'big') % self.PAGES_PER_VOLUME) + 1
 
         address = f"{hex_name}-w{wall}-s{shelf}-v{volume}:{page}"
 
-        self._address_cache[address] = {
+        self._manage_cache(self._address_cache, address, {
             'text': text_input,
             'location_variant': location_variant
-        }
+        })
 
         return address
 
     def generate_deterministic_content(self, address, content_text=None):
         """Generate deterministic content for an address"""
-        if address in self._content_cache:
-            return self._content_cache[address]
+        cached = self._cache_get(self._content_cache, address)
+        if cached is not None:
+            return cached
 
         if content_text:
             # Use provided content directly
@@ -204,46 +224,92 @@ class LibraryOfBabel:
         else:
             # Generate random content for non-search addresses
             content_seed = self.CONSTANT_SEED + address
-            hash_obj = hashlib.sha256(content_seed.encode())
-            seed_value = int(hash_obj.hexdigest(), 16)
-
-            random.seed(seed_value)
-            content = []
-            for i in range(self.PAGE_LENGTH):
-                content.append(self.CHARSET[random.randint(0, self.BASE - 1)])
-            result = ''.join(content)
+            result = self._generate_random_text(content_seed, self.PAGE_LENGTH)
+
+        return self._manage_cache(self._content_cache, address, result)
+
+    def generate_deterministic_preview(self, address, length):
+        """Generate the first `length` characters of an address without caching"""
+        content = self._content_cache.get(address)
+        if content is not None:
+            return content[:length]
+
+        cached_info = self._address_cache.get(address)
+        if cached_info is not None:
+            return cached_info['text'][:length]
+
+        # The SHAKE stream is prefix-stable, so this matches the start of the full page
+        return self._generate_random_text(self.CONSTANT_SEED + address, length)
+
+    def _cache_get(self, cache, key):
+        """Return a cached value and mark it most recently used, or None on a miss"""
+        with self._cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+            return None
+
+    def _manage_cache(self, cache, key, value):
+        """Store value in an LRU cache, evicting the oldest entries past max_cache_size"""
+        with self._cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+            cache[key] = value
+            while len(cache) > self.max_cache_size:
+                cache.popitem(last=False)
+
+            return value
+
+    def _generate_random_text(self, seed, length):
+        """Generate `length` uniformly random characters from a seed string"""
+        return self._read_random_text(hashlib.shake_128(seed.encode()), length)
+
+    def _read_random_text(self, stream, length):
+        """Read `length` uniformly random characters from a seeded SHAKE-128 object"""
+        # Map the whole byte stream at C level. Size the first read from the
+        # acceptance rate plus a small margin, and ask for more bytes in the
+        # rare case that rejection leaves too few characters
+        size = length * 256 // (256 - len(self._REJECT_BYTES)) + length // 32 + 32
+        while True:
+            chars = stream.digest(size).translate(self._CHARSET_TABLE, self._REJECT_BYTES)
+            if len(chars) >= length:
+                return chars[:length].decode('ascii')
+            size *= 2
+
+    def _batch_previews(self, prefix, suffixes, length):
+        """Generate previews for the addresses prefix + suffix, hashing the shared prefix once"""
+        base = hashlib.shake_128((self.CONSTANT_SEED + prefix).encode())
+        previews = []
+
+        for suffix in suffixes:
+            address = prefix + suffix
+            if address in self._content_cache or address in self._address_cache:
+                previews.append(self.generate_deterministic_preview(address, length))
+            else:
+                # Same stream as hashing CONSTANT_SEED + address from scratch
+                stream = base.copy()
+                stream.update(suffix.encode())
+                previews.append(self._read_random_text(stream, length))
 
-        self._content_cache[address] = result
-        return result
+        return previews
 
     def parse_address(self, address):
         """Parse address string into components"""
-        try:
-            if ':' not in address:
-                raise ValueError("Invalid address format")
-
-            hex_part, page_str = address.rsplit(':', 1)
-            page = int(page_str)
-
-            parts = hex_part.split('-')
-            if len(parts) < 4:
-                raise ValueError("Invalid address format")
-
-            hex_name = parts[0]
-            wall = int(parts[1][1:])
-            shelf = int(parts[2][1:])
-            volume = int(parts[3][1:])
-
-            return hex_name, wall, shelf, volume, page
-        except (ValueError, IndexError) as e:
+        match = self._ADDR_RE.fullmatch(address.strip())
+        if not match:
             raise ValueError(f"Invalid address format: {address}")
 
+        hex_name, wall, shelf, volume, page = match.groups()
+        return hex_name, int(wall), int(shelf), int(volume), int(page)
+
     def search_text(self, search_text, num_exact_locations=3, num_similar_results=5):
         """Enhanced search with refined exact and similar matching"""
         if not search_text.strip():
             return []
 
-        clean_text = ''.join(c for c in search_text.lower() if c in self.CHARSET)
+        clean_text = self._clean_text(search_text)
         if not clean_text:
             return []
 
@@ -256,19 +322,16 @@ class LibraryOfBabel:
             address = self._create_deterministic_address(variation['text'], i)
             content = self.generate_deterministic_content(address, variation['text'])
 
-            # Verify exact text is present at the beginning
-            text_position = content.find(clean_text)
-
-            results.append({
-                'address': address,
-                'content': content,
-                'search_text': clean_text,
-                'original_query': search_text,
-                'position': text_position,
-                'type': 'exact',
-                'variation': i + 1,
-                'description': variation['description']
-            })
+            results.append(SearchResult(
+                address=address,
+                content=content,
+                search_text=clean_text,
+                original_query=search_text,
+                position=variation['position'],
+                type='exact',
+                variation=i + 1,
+                description=variation['description']
+            ))
 
         # Generate similar match variations
         if num_similar_results > 0:
@@ -278,28 +341,31 @@ class LibraryOfBabel:
                 address = self._create_deterministic_address(variation['text'], i + num_exact_locations)
                 content = self.generate_deterministic_content(address, variation['text'])
 
-                # Find position of exact text within the similar match
-                text_position = content.find(clean_text)
-
-                results.append({
-                    'address': address,
-                    'content': content,
-                    'search_text': clean_text,
-                    'original_query': search_text,
-                    'position': text_position,
-                    'type': 'similar',
-                    'variation': i + 1,
-                    'description': variation['description'],
-                    'similarity_type': variation['type']
-                })
+                results.append(SearchResult(
+                    address=address,
+                    content=content,
+                    search_text=clean_text,
+                    original_query=search_text,
+                    position=variation['position'],
+                    type='similar',
+                    variation=i + 1,
+                    description=variation['description'],
+                    similarity_type=variation['type']
+                ))
 
         return results
 
     def generate_page_from_address(self, address):
         """Generate page content from address"""
         try:
-            if address in self._address_cache:
-                cached_info = self._address_cache[address]
+            # The content cache covers both searched and previously generated pages
+            cached = self._cache_get(self._content_cache, address)
+            if cached is not None:
+                return cached
+
+            # Fall back to the search text for addresses whose content was evicted
+            cached_info = self._cache_get(self._address_cache, address)
+            if cached_info is not None:
                 return self.generate_deterministic_content(address, cached_info['text'])
 
             return self.generate_deterministic_content(address)
@@ -329,54 +395,38 @@ class LibraryOfBabel:
 
     def browse_hex_structure(self, hex_name, wall=None, shelf=None, volume=None):
         """Browse hex structure with consistent addressing"""
-        results = []
-
+        # Every listed address shares a prefix, so previews are generated in one batch
         if wall is None:
-            for w in range(1, self.WALLS_PER_HEX + 1):
-                sample_address = f"{hex_name}-w{w}-s1-v1:1"
-                sample_content = self.generate_deterministic_content(sample_address)[:50]
-                results.append({
-                    'type': 'wall',
-                    'identifier': f"Wall {w}",
-                    'address': sample_address,
-                    'preview': sample_content + "..."
-                })
+            item_type, prefix, preview_length = 'wall', f"{hex_name}-w", 50
+            suffixes = [f"{w}-s1-v1:1" for w in range(1, self.WALLS_PER_HEX + 1)]
         elif shelf is None:
-            for s in range(1, self.SHELVES_PER_WALL + 1):
-                sample_address = f"{hex_name}-w{wall}-s{s}-v1:1"
-                sample_content = self.generate_deterministic_content(sample_address)[:50]
-                results.append({
-                    'type': 'shelf',
-                    'identifier': f"Shelf {s}",
-                    'address': sample_address,
-                    'preview': sample_content + "..."
-                })
+            item_type, prefix, preview_length = 'shelf', f"{hex_name}-w{wall}-s", 50
+            suffixes = [f"{s}-v1:1" for s in range(1, self.SHELVES_PER_WALL + 1)]
         elif volume is None:
-            for v in range(1, self.VOLUMES_PER_SHELF + 1):
-                sample_address = f"{hex_name}-w{wall}-s{shelf}-v{v}:1"
-                sample_content = self.generate_deterministic_content(sample_address)[:50]
-                results.append({
-                    'type': 'volume',
-                    'identifier': f"Volume {v}",
-                    'address': sample_address,
-                    'preview': sample_content + "..."
-                })
+            item_type, prefix, preview_length = 'volume', f"{hex_name}-w{wall}-s{shelf}-v", 50
+            suffixes = [f"{v}:1" for v in range(1, self.VOLUMES_PER_SHELF + 1)]
         else:
-            for p in range(1, self.PAGES_PER_VOLUME + 1):
-                address = f"{hex_name}-w{wall}-s{shelf}-v{volume}:{p}"
-                content_preview = self.generate_deterministic_content(address)[:100]
-                results.append({
-                    'type': 'page',
-                    'identifier': f"Page {p}",
-                    'address': address,
-                    'preview': content_preview + "..."
-                })
+            item_type, prefix, preview_length = 'page', f"{hex_name}-w{wall}-s{shelf}-v{volume}:", 100
+            suffixes = [str(p) for p in range(1, self.PAGES_PER_VOLUME + 1)]
+
+        previews = self._batch_previews(prefix, suffixes, preview_length)
+
+        results = []
+        for number, (suffix, preview) in enumerate(zip(suffixes, previews), 1):
+            results.append({
+                'type': item_type,
+                'identifier': f"{item_type.capitalize()} {number}",
+                'address': prefix + suffix,
+                'preview': preview + "..."
+            })
 
         return results
 
 
 # GUI Implementation with Enhanced Search Display
 class LibraryOfBabelGUI:
+    SEARCH_STATUS = "Performing refined search..."
+
     def __init__(self):
         self.library = LibraryOfBabel()
         self.root = tk.Tk()
@@ -391,6 +441,10 @@ class LibraryOfBabelGUI:
         self.button_active_bg = '#0f3460'
         self.highlight_color = '#00d4aa'
 
+        # Searches still running on worker threads; the status bar stays on the
+        # search message until the last one reports back
+        self._pending_searches = 0
+
         self.create_widgets()
         self.show_welcome()
 
@@ -455,6 +509,16 @@ class LibraryOfBabelGUI:
             col = i % 2
             btn.grid(row=row, column=col, padx=10, pady=10)
 
+        self.status_label = tk.Label(
+            self.root,
+            text="Ready",
+            anchor='w',
+            font=("Arial", 10),
+            bg=self.bg_color,
+            fg=self.fg_color
+        )
+        self.status_label.pack(side='bottom', fill='x', padx=10, pady=5)
+
     def set_custom_seed(self):
         """Allow user to set custom seed"""
         new_seed = simpledialog.askstring(
@@ -525,37 +589,38 @@ maintaining the infinite library concept."""
         text_widget.pack(fill='both', expand=True)
 
         if is_search and isinstance(results, list):
-            content = f"REFINED SEARCH RESULTS ({len(results)} locations found)\n"
-            content += "=" * 70 + "\n\n"
+            parts = [f"REFINED SEARCH RESULTS ({len(results)} locations found)\n", "=" * 70 + "\n\n"]
 
-            exact_results = [r for r in results if r['type'] == 'exact']
-            similar_results = [r for r in results if r['type'] == 'similar']
+            exact_results = [r for r in results if r.type == 'exact']
+            similar_results = [r for r in results if r.type == 'similar']
 
             if exact_results:
-                content += f"EXACT MATCHES ({len(exact_results)} locations):\n"
-                content += "Full searched text present exactly as entered\n"
-                content += "-" * 50 + "\n\n"
+                parts.append(f"EXACT MATCHES ({len(exact_results)} locations):\n")
+                parts.append("Full searched text present exactly as entered\n")
+                parts.append("-" * 50 + "\n\n")
 
                 for result in exact_results:
-                    content += f"Exact Match {result['variation']}:\n"
-                    content += f"Description: {result['description']}\n"
-                    content += f"Address: {result['address']}\n"
-                    content += f"Text Position: {result['position']}\n"
-                    content += f"Content Preview:\n{result['content'][:200]}...\n\n"
-                    content += "~" * 60 + "\n\n"
+                    parts.append(f"Exact Match {result.variation}:\n")
+                    parts.append(f"Description: {result.description}\n")
+                    parts.append(f"Address: {result.address}\n")
+                    parts.append(f"Text Position: {result.position}\n")
+                    parts.append(f"Content Preview:\n{result.content[:200]}...\n\n")
+                    parts.append("~" * 60 + "\n\n")
 
             if similar_results:
-                content += f"SIMILAR MATCHES ({len(similar_results)} found):\n"
-                content += "Exact text with spaces or as substring\n"
-                content += "-" * 50 + "\n\n"
+                parts.append(f"SIMILAR MATCHES ({len(similar_results)} found):\n")
+                parts.append("Exact text with spaces or as substring\n")
+                parts.append("-" * 50 + "\n\n")
 
                 for result in similar_results:
-                    content += f"Similar Match {result['variation']}:\n"
-                    content += f"Type: {result['description']}\n"
-                    content += f"Address: {result['address']}\n"
-                    content += f"Text Position: {result['position']}\n"
-                    content += f"Content Preview:\n{result['content'][:200]}...\n\n"
-                    content += "~" * 60 + "\n\n"
+                    parts.append(f"Similar Match {result.variation}:\n")
+                    parts.append(f"Type: {result.description}\n")
+                    parts.append(f"Address: {result.address}\n")
+                    parts.append(f"Text Position: {result.position}\n")
+                    parts.append(f"Content Preview:\n{result.content[:200]}...\n\n")
+                    parts.append("~" * 60 + "\n\n")
+
+            content = ''.join(parts)
         else:
             content = results
 
@@ -622,26 +687,45 @@ maintaining the infinite library concept."""
             messagebox.showwarning("Text Too Long", "Search text limited to 1000 characters.")
             return
 
-        self.show_processing("Performing refined search...")
+        self._pending_searches += 1
+        self.show_processing(self.SEARCH_STATUS)
 
+        # Search off the Tk main thread; results are handed back through root.after
+        threading.Thread(target=self._do_search, args=(search_term,), daemon=True).start()
+
+    def _do_search(self, search_term):
+        """Run a search on a worker thread and post the outcome to the GUI"""
         try:
             results = self.library.search_text(
                 search_term,
                 num_exact_locations=3,
                 num_similar_results=5
             )
+        except Exception as e:
+            self.root.after(0, lambda error=e: self._show_search_error(error))
+            return
 
-            if results:
-                self.create_results_window(
-                    f"Refined Search Results - '{search_term}'",
-                    results,
-                    is_search=True
-                )
-            else:
-                messagebox.showinfo("No Results", "No results found for the search term.")
+        self.root.after(0, lambda: self._show_search_results(search_term, results))
 
-        except Exception as e:
-            messagebox.showerror("Search Error", f"Error during search: {str(e)}")
+    def _show_search_results(self, search_term, results):
+        """Display search results (runs on the Tk main thread)"""
+        self._pending_searches -= 1
+        self.clear_status()
+
+        if results:
+            self.create_results_window(
+                f"Refined Search Results - '{search_term}'",
+                results,
+                is_search=True
+            )
+        else:
+            messagebox.showinfo("No Results", "No results found for the search term.")
+
+    def _show_search_error(self, error):
+        """Report a failed search (runs on the Tk main thread)"""
+        self._pending_searches -= 1
+        self.clear_status()
+        messagebox.showerror("Search Error", f"Error during search: {str(error)}")
 
     def browse_address(self):
         """Browse specific address"""
@@ -671,6 +755,8 @@ maintaining the infinite library concept."""
 
         except Exception as e:
             messagebox.showerror("Browse Error", f"Error browsing address: {str(e)}")
+        finally:
+            self.clear_status()
 
     def browse_hex_structure(self):
         """Browse hex structure"""
@@ -774,6 +860,8 @@ maintaining the infinite library concept."""
 
         except Exception as e:
             messagebox.showerror("Generation Error", f"Error generating random page: {str(e)}")
+        finally:
+            self.clear_status()
 
     def show_statistics(self):
         """Display library statistics"""
@@ -800,27 +888,16 @@ The refined search ensures that:
         messagebox.showinfo("Refined Search Statistics", stats_text)
 
     def show_processing(self, message):
-        """Show processing dialog"""
-        processing_window = tk.Toplevel(self.root)
-        processing_window.title("Processing")
-        processing_window.geometry("300x100")
-        processing_window.configure(bg=self.bg_color)
-        processing_window.resizable(False, False)
-
-        processing_window.transient(self.root)
-        processing_window.grab_set()
-
-        label = tk.Label(
-            processing_window,
-            text=message,
-            font=("Arial", 12),
-            bg=self.bg_color,
-            fg=self.fg_color
-        )
-        label.pack(expand=True)
-
-        processing_window.update()
-        self.root.after(500, processing_window.destroy)
+        """Show processing message in the status bar"""
+        self.status_label.config(text=message)
+        self.root.update_idletasks()
+
+    def clear_status(self):
+        """Reset the status bar once an operation has finished, unless a search is still running"""
+        if self._pending_searches:
+            self.status_label.config(text=self.SEARCH_STATUS)
+        else:
+            self.status_label.config(text="Ready")
 
     def run(self):
         """Start the application"""
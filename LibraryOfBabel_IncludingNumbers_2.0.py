@@ -1,12 +1,37 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk, BooleanVar
 from tkinter.scrolledtext import ScrolledText
+import functools
 import hashlib
 import random
+import secrets
 import string
 import math
+import re
 import threading
-from collections import OrderedDict
+from itertools import islice
+
+
+# Byte -> base-36 character table used when building hex names
+_HEX36_TABLE = bytes(b"0123456789abcdefghijklmnopqrstuvwxyz"[b % 36] for b in range(256))
+
+# Precomputed hex lengths for the two built-in charsets at the default page length,
+# keyed by (charset_size, page_length)
+_HEX_LENGTHS = {(29, 1000): 940, (39, 1000): 1023}
+
+# log10 of the two built-in charset sizes, used by the statistics report
+_LOG10_CHARSET = {29: math.log10(29), 39: math.log10(39)}
+
+# Shape of a library address, checked in the GUI before handing input to the library.
+# The hex part takes anything but '-', matching how parse_address splits it.
+_ADDR_RE = re.compile(r'^[^-]+-w\d+-s\d+-v\d+:\d+$')
+
+# Separator rules used by the result windows
+_SEP_EQ = "=" * 80
+_SEP_DASH = "-" * 40
+_SEP_RESULTS = "_" * 120 + "\n\n"
+_SEP_RESULTS_BLANK = " " * 120 + "\n\n"
+_SEP_RESULTS_END = "\n" + "=" * 120 + "\n"
 
 
 class LibraryOfBabel:
@@ -17,6 +42,7 @@ class LibraryOfBabel:
         self.PAGE_LENGTH = 1000
         self.set_charset(include_numbers)
         self.CONSTANT_SEED = "8e447372cbc75ffc238749baf6eccbec586104336af37347606d14c698eaec1f"
+        self._prepare_seed()
 
         # Library structure (Borgesian dimensions)
         self.WALLS_PER_HEX = 5
@@ -24,10 +50,13 @@ class LibraryOfBabel:
         self.VOLUMES_PER_SHELF = 32
         self.PAGES_PER_VOLUME = 410
 
-        # Thread-safe caches with size limits
+        # Thread-safe caches with size limits. Plain dicts keep insertion order; a hit
+        # re-inserts its entry at the end, so eviction from the front drops the least
+        # recently used entries. Search result pages cannot be regenerated, so a page
+        # that keeps being reopened must not age out.
         self._cache_lock = threading.RLock()
-        self._address_cache = OrderedDict()
-        self._content_cache = OrderedDict()
+        self._address_cache = {}
+        self._content_cache = {}
 
     def set_charset(self, include_numbers):
         """Set character set and calculate correct hex length for theoretical completeness."""
@@ -38,9 +67,22 @@ class LibraryOfBabel:
             self.CHARSET = string.ascii_lowercase + ' ,.'  # 29 characters
             self.HEX_LENGTH = self._calculate_required_hex_length(29)  # 940 characters
         self.BASE = len(self.CHARSET)
+        self._charset_bytes = self.CHARSET.encode('ascii')
+
+        # Byte -> character table for page generation. Bytes at or above the largest
+        # multiple of BASE are rejected so every character stays equally likely.
+        self._charset_table = bytes(self._charset_bytes[b % self.BASE] for b in range(256))
+        self._reject_bytes = bytes(range(256 - 256 % self.BASE, 256))
+
+        # ASCII bytes outside CHARSET, deleted by bytes.translate when cleaning input
+        self._invalid_bytes = bytes(b for b in range(128) if b not in self._charset_bytes)
 
     def _calculate_required_hex_length(self, charset_size):
         """Calculate the exact required hex length for theoretical completeness."""
+        known = _HEX_LENGTHS.get((charset_size, self.PAGE_LENGTH))
+        if known is not None:
+            return known
+
         # Total possible pages = charset_size^PAGE_LENGTH
         # Hex namespace = 36^L (36 possible chars per hex digit)
         # Solve: 36^L >= charset_size^PAGE_LENGTH
@@ -52,101 +94,158 @@ class LibraryOfBabel:
         """Toggle number inclusion and clear caches."""
         self.include_numbers = include_numbers
         self.set_charset(include_numbers)
-        with self._cache_lock:
-            self._address_cache.clear()
-            self._content_cache.clear()
+        self._clear_caches()
 
     def set_seed(self, new_seed):
         """Set new cryptographic seed and clear caches."""
         self.CONSTANT_SEED = new_seed
+        self._prepare_seed()
+        self._clear_caches()
+
+    def _clear_caches(self):
+        """Empty the address and content caches."""
         with self._cache_lock:
             self._address_cache.clear()
             self._content_cache.clear()
 
+    def _prepare_seed(self):
+        """Hash the seed once so hot paths can start from a copy of its hash states."""
+        self._seed_bytes = self.CONSTANT_SEED.encode()
+        self._seed_hasher = hashlib.sha256(self._seed_bytes)
+        self._seed_stream = hashlib.shake_128(self._seed_bytes)
+
     def _generate_hex_name(self, base_input, variant=0):
         """Improved hex name generation using full 36-character space efficiently."""
-        hex_chars = "0123456789abcdefghijklmnopqrstuvwxyz"
-        combined_input = self.CONSTANT_SEED + str(base_input) + str(variant)
-        hex_name = ""
-        current_hash = hashlib.sha256(combined_input.encode()).hexdigest()
-
-        # Use multiple hash rounds for better distribution
-        hash_counter = 0
-        while len(hex_name) < self.HEX_LENGTH:
-            for i in range(0, len(current_hash), 2):
-                if len(hex_name) >= self.HEX_LENGTH:
-                    break
-                # Use pairs of hex chars for better distribution across full 36-char space
-                pair_val = int(current_hash[i:i + 2], 16) if i + 1 < len(current_hash) else int(current_hash[i], 16)
-                hex_name += hex_chars[pair_val % 36]
-
-            if len(hex_name) < self.HEX_LENGTH:
-                hash_counter += 1
-                current_hash = hashlib.sha256((current_hash + str(hash_counter)).encode()).hexdigest()
-
-        return hex_name[:self.HEX_LENGTH]
+        return self._hex_name_bytes(str(base_input).encode(), str(variant).encode()).decode('ascii')
+
+    def _hex_name_bytes(self, input_bytes, variant_bytes):
+        """Build the ASCII bytes of a hex name from already-encoded input and variant."""
+        hasher = self._seed_hasher.copy()
+        hasher.update(input_bytes)
+        hasher.update(variant_bytes)
+
+        # Counter-mode digests: each round copies the prefix state and appends the counter,
+        # so the seed and input are never rehashed or concatenated as strings
+        rounds = -(-self.HEX_LENGTH // hasher.digest_size)
+        digests = []
+        for counter in range(rounds):
+            round_hasher = hasher.copy()
+            round_hasher.update(counter.to_bytes(4, 'big'))
+            digests.append(round_hasher.digest())
+
+        # Map every raw digest byte onto the full 36-character space in one C-level call
+        stream = b''.join(digests)[:self.HEX_LENGTH]
+        return stream.translate(_HEX36_TABLE)
+
+    def _cache_get(self, cache, key):
+        """Return a cached value and mark it most recently used, or None on a miss."""
+        with self._cache_lock:
+            if key not in cache:
+                return None
+            cache[key] = value = cache.pop(key)
+            return value
 
     def _manage_cache(self, cache, key, value):
         """Thread-safe cache management with LRU eviction and size limits."""
         with self._cache_lock:
             if key in cache:
-                # Move to end (most recently used)
-                cache.move_to_end(key)
-                return cache[key]
+                cache[key] = value = cache.pop(key)
+                return value
 
             cache[key] = value
-            cache.move_to_end(key)
 
-            # Remove oldest entries if cache exceeds limit
-            while len(cache) > self.max_cache_size:
-                cache.popitem(last=False)
+            # Once over the limit, remove the least recently used entries in one batch.
+            # Popping dict heads one at a time rescans the deleted slots on every
+            # eviction; trimming an extra eighth keeps the cost amortized O(1).
+            if len(cache) > self.max_cache_size:
+                excess = len(cache) - self.max_cache_size + self.max_cache_size // 8
+                for old_key in list(islice(cache, excess)):
+                    del cache[old_key]
 
             return value
 
     def _create_deterministic_address(self, text_input, location_variant=0):
         """Create deterministic address with improved coordinate generation."""
-        hex_name = self._generate_hex_name(text_input, location_variant)
-        coord_seed = self.CONSTANT_SEED + hex_name + str(location_variant)
-        coord_hash = hashlib.sha256(coord_seed.encode()).hexdigest()
-
-        wall = (int(coord_hash[0:4], 16) % self.WALLS_PER_HEX) + 1
-        shelf = (int(coord_hash[4:8], 16) % self.SHELVES_PER_WALL) + 1
-        volume = (int(coord_hash[8:12], 16) % self.VOLUMES_PER_SHELF) + 1
-        page = (int(coord_hash[12:16], 16) % self.PAGES_PER_VOLUME) + 1
-
-        address = f"{hex_name}-w{wall}-s{shelf}-v{volume}:{page}"
-        return address
+        key = (text_input, location_variant)
+        address = self._cache_get(self._address_cache, key)
+        if address is not None:
+            return address
+
+        # Encode the variant once and feed the hex name bytes straight into the
+        # coordinate hash instead of rebuilding and re-encoding the joined string
+        variant_bytes = str(location_variant).encode()
+        hex_bytes = self._hex_name_bytes(str(text_input).encode(), variant_bytes)
+        coord_hasher = self._seed_hasher.copy()
+        coord_hasher.update(hex_bytes)
+        coord_hasher.update(variant_bytes)
+        coord_hash = coord_hasher.digest()
+
+        # Two raw digest bytes carry the same value as four hex digits
+        wall = (int.from_bytes(coord_hash[0:2], 'big') % self.WALLS_PER_HEX) + 1
+        shelf = (int.from_bytes(coord_hash[2:4], 'big') % self.SHELVES_PER_WALL) + 1
+        volume = (int.from_bytes(coord_hash[4:6], 'big') % self.VOLUMES_PER_SHELF) + 1
+        page = (int.from_bytes(coord_hash[6:8], 'big') % self.PAGES_PER_VOLUME) + 1
+
+        address = f"{hex_bytes.decode('ascii')}-w{wall}-s{shelf}-v{volume}:{page}"
+        return self._manage_cache(self._address_cache, key, address)
 
     def generate_deterministic_content(self, address, content_text=None):
         """Generate deterministic content with improved caching."""
-        with self._cache_lock:
-            if address in self._content_cache:
-                return self._content_cache[address]
+        cached = self._cache_get(self._content_cache, address)
+        if cached is not None:
+            return cached
 
         if content_text:
             content = content_text
         else:
-            content_seed = self.CONSTANT_SEED + address
-            hash_obj = hashlib.sha256(content_seed.encode())
-            seed_value = int(hash_obj.hexdigest(), 16)
-            rng = random.Random(seed_value)
-            content = ''.join(rng.choice(self.CHARSET) for _ in range(self.PAGE_LENGTH))
+            content = self._generate_random_text(address, self.PAGE_LENGTH)
 
         return self._manage_cache(self._content_cache, address, content)
 
-    def _create_exact_match_variations(self, text, num_variants=1):
+    def _generate_random_text(self, address, length):
+        """Generate uniformly random characters for an address in a single C-level pass."""
+        stream = self._seed_stream.copy()
+        stream.update(address.encode())
+        return self._read_random_text(stream, length)
+
+    def _generate_preview(self, address, n_chars):
+        """Return the first n_chars of a page without generating or caching the whole page."""
+        content = self._cache_get(self._content_cache, address)
+        if content is not None:
+            return content[:n_chars]
+
+        # The SHAKE stream is prefix-stable, so a short read yields the page's opening
+        return self._generate_random_text(address, n_chars)
+
+    def _read_random_text(self, stream, length):
+        """Map an already-seeded SHAKE-128 stream onto CHARSET characters."""
+        # Size the first read from the acceptance rate plus a small margin; read more
+        # in the rare case that rejection leaves too few characters
+        size = length * 256 // (256 - len(self._reject_bytes)) + length // 32 + 32
+        while True:
+            chars = stream.digest(size).translate(self._charset_table, self._reject_bytes)
+            if len(chars) >= length:
+                return chars[:length].decode('ascii')
+            size *= 2
+
+    def _clean_text(self, text):
+        """Lowercase text and drop every character outside CHARSET in a single C-level pass."""
+        # Non-ASCII characters are never in CHARSET, so the encode drops them up front
+        return text.lower().encode('ascii', 'ignore').translate(None, self._invalid_bytes).decode('ascii')
+
+    def _create_exact_match_variations(self, clean_text, num_variants=1):
         """Create exact match variations with proper padding."""
-        clean_text = ''.join(c for c in text.lower() if c in self.CHARSET)
         variations = []
 
-        for i in range(num_variants):
-            if len(clean_text) <= self.PAGE_LENGTH:
-                exact_content = clean_text + ' ' * (self.PAGE_LENGTH - len(clean_text))
-            else:
-                exact_content = clean_text[:self.PAGE_LENGTH]
+        # The padded page is the same for every variant
+        if len(clean_text) <= self.PAGE_LENGTH:
+            exact_content = clean_text + ' ' * (self.PAGE_LENGTH - len(clean_text))
+        else:
+            exact_content = clean_text[:self.PAGE_LENGTH]
 
+        for i in range(num_variants):
             address = self._create_deterministic_address(exact_content, i)
-            self.generate_deterministic_content(address, exact_content)
+            self._manage_cache(self._content_cache, address, exact_content)
 
             variations.append({
                 'address': address,
@@ -159,9 +258,8 @@ class LibraryOfBabel:
 
         return variations
 
-    def _create_similar_match_variations(self, text, num_variants=5):
+    def _create_similar_match_variations(self, clean_text, num_variants=5):
         """Fixed similar match generation with proper bounds checking."""
-        clean_text = ''.join(c for c in text.lower() if c in self.CHARSET)
         if not clean_text:
             return []
 
@@ -169,24 +267,25 @@ class LibraryOfBabel:
         if len(clean_text) > self.PAGE_LENGTH:
             clean_text = clean_text[:self.PAGE_LENGTH]
 
+        addresses = [self._create_deterministic_address(clean_text, i + 1000) for i in range(num_variants)]
+
+        # Draw every insertion point from a 128-bit Lehmer generator seeded by a single hash
+        # of all addresses; the high 64 bits of each step are scaled onto the valid range.
+        # If the text fills the entire page, max_insert_pos is 0 and it lands at the beginning.
+        max_insert_pos = max(0, self.PAGE_LENGTH - len(clean_text))
+        batch_digest = hashlib.sha256(''.join(addresses).encode()).digest()
+        state = int.from_bytes(batch_digest[:16], 'little') | 1
+        positions = []
+        for _ in addresses:
+            state = (state * 0xda942042e4dd58b5) & 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
+            positions.append(((state >> 64) * (max_insert_pos + 1)) >> 64)
+
         variations = []
-        for i in range(num_variants):
-            address = self._create_deterministic_address(clean_text, i + 1000)
-            content = self.generate_deterministic_content(address)
-            content_list = list(content)
-
-            # Safe insertion position calculation
-            max_insert_pos = max(0, self.PAGE_LENGTH - len(clean_text))
-            if max_insert_pos > 0:
-                rng = random.Random(hash(address) % (2 ** 32))
-                insert_pos = rng.randint(0, max_insert_pos)
-                content_list[insert_pos:insert_pos + len(clean_text)] = list(clean_text)
-            else:
-                # If text fills entire page, place at beginning
-                content_list[:len(clean_text)] = list(clean_text)
-                insert_pos = 0
-
-            new_content = ''.join(content_list)
+        for address, insert_pos in zip(addresses, positions):
+            # Splice the text into the random page with slices; the unspliced page is not
+            # cached, so the stored content for this address is the organic match
+            content = self._generate_random_text(address, self.PAGE_LENGTH)
+            new_content = content[:insert_pos] + clean_text + content[insert_pos + len(clean_text):]
             self._manage_cache(self._content_cache, address, new_content)
 
             variations.append({
@@ -206,7 +305,7 @@ class LibraryOfBabel:
             return []
 
         original_text = search_text
-        clean_text = ''.join(c for c in search_text.lower() if c in self.CHARSET)
+        clean_text = self._clean_text(search_text)
 
         # Provide feedback for Unicode or unsupported characters
         if not clean_text and original_text.strip():
@@ -267,18 +366,23 @@ class LibraryOfBabel:
         """Generate page from address with comprehensive error handling."""
         try:
             # Validate address format first
-            self.parse_address(address)
-            return self.generate_deterministic_content(address)
+            return self.generate_page_from_parsed(*self.parse_address(address))
         except ValueError as e:
             return f"Invalid address format: {e}"
 
+    def generate_page_from_parsed(self, hex_name, wall, shelf, volume, page):
+        """Generate page content for an already-validated location without re-parsing."""
+        return self.generate_deterministic_content(f"{hex_name}-w{wall}-s{shelf}-v{volume}:{page}")
+
     def generate_random_page(self):
         """Generate truly random page with full address information."""
-        wall = random.randint(1, self.WALLS_PER_HEX)
-        shelf = random.randint(1, self.SHELVES_PER_WALL)
-        volume = random.randint(1, self.VOLUMES_PER_SHELF)
-        page = random.randint(1, self.PAGES_PER_VOLUME)
-        hex_name = self._generate_hex_name(str(random.random()), 0)
+        # One 64-bit draw supplies all four coordinates, 16 bits each
+        bits = random.getrandbits(64)
+        wall = (bits & 0xFFFF) % self.WALLS_PER_HEX + 1
+        shelf = ((bits >> 16) & 0xFFFF) % self.SHELVES_PER_WALL + 1
+        volume = ((bits >> 32) & 0xFFFF) % self.VOLUMES_PER_SHELF + 1
+        page = (bits >> 48) % self.PAGES_PER_VOLUME + 1
+        hex_name = self._generate_hex_name(secrets.token_hex(16), 0)
         address = f"{hex_name}-w{wall}-s{shelf}-v{volume}:{page}"
         content = self.generate_deterministic_content(address)
 
@@ -291,53 +395,68 @@ class LibraryOfBabel:
             'page': page
         }
 
-    def browse_hex_structure(self, hex_name, wall=None, shelf=None, volume=None):
+    def browse_hex_structure(self, hex_name, wall=None, shelf=None, volume=None, previews=True):
         """Browse library structure with proper navigation hierarchy."""
+        # With previews=False every preview is None and no page text is generated, so a
+        # level can be listed instantly and previews fetched on demand
         results = []
 
         if wall is None:
             # Browse walls
             for w in range(1, self.WALLS_PER_HEX + 1):
                 sample_address = f"{hex_name}-w{w}-s1-v1:1"
-                sample_content = self.generate_deterministic_content(sample_address)[:50]
                 results.append({
                     'type': 'wall',
                     'identifier': f"Wall {w}",
                     'address': sample_address,
-                    'preview': sample_content + "..."
+                    'location': (hex_name, w, 1, 1, 1),
+                    'preview': self._generate_preview(sample_address, 50) + "..." if previews else None
                 })
         elif shelf is None:
             # Browse shelves within wall
             for s in range(1, self.SHELVES_PER_WALL + 1):
                 sample_address = f"{hex_name}-w{wall}-s{s}-v1:1"
-                sample_content = self.generate_deterministic_content(sample_address)[:50]
                 results.append({
                     'type': 'shelf',
                     'identifier': f"Shelf {s}",
                     'address': sample_address,
-                    'preview': sample_content + "..."
+                    'location': (hex_name, wall, s, 1, 1),
+                    'preview': self._generate_preview(sample_address, 50) + "..." if previews else None
                 })
         elif volume is None:
             # Browse volumes within shelf
             for v in range(1, self.VOLUMES_PER_SHELF + 1):
                 sample_address = f"{hex_name}-w{wall}-s{shelf}-v{v}:1"
-                sample_content = self.generate_deterministic_content(sample_address)[:50]
                 results.append({
                     'type': 'volume',
                     'identifier': f"Volume {v}",
                     'address': sample_address,
-                    'preview': sample_content + "..."
+                    'location': (hex_name, wall, shelf, v, 1),
+                    'preview': self._generate_preview(sample_address, 50) + "..." if previews else None
                 })
         else:
-            # Browse pages within volume
+            # Browse pages within volume. Every page seed shares the same prefix, so
+            # absorb it once and copy the hash state for each page number.
+            volume_address = f"{hex_name}-w{wall}-s{shelf}-v{volume}:"
+            prefix_stream = self._seed_stream.copy()
+            prefix_stream.update(volume_address.encode())
             for p in range(1, self.PAGES_PER_VOLUME + 1):
-                address = f"{hex_name}-w{wall}-s{shelf}-v{volume}:{p}"
-                content_preview = self.generate_deterministic_content(address)[:100]
+                address = volume_address + str(p)
+                preview = None
+                if previews:
+                    content = self._cache_get(self._content_cache, address)
+                    if content is not None:
+                        preview = content[:100] + "..."
+                    else:
+                        stream = prefix_stream.copy()
+                        stream.update(str(p).encode())
+                        preview = self._read_random_text(stream, 100) + "..."
                 results.append({
                     'type': 'page',
                     'identifier': f"Page {p}",
                     'address': address,
-                    'preview': content_preview + "..."
+                    'location': (hex_name, wall, shelf, volume, p),
+                    'preview': preview
                 })
 
         return results
@@ -372,8 +491,29 @@ class LibraryOfBabelGUI:
         # Step 3: Create Tkinter variables AFTER root window
         self.include_numbers = BooleanVar(value=False)
 
-        # Step 4: Initialize library
+        # Step 4: Initialize library. Pages and structure listings opened from the GUI go
+        # through bounded LRUs so drilling down and back never regenerates the same view.
         self.library = LibraryOfBabel(include_numbers=False)
+        self._cached_page = functools.lru_cache(maxsize=512)(self.library.generate_page_from_parsed)
+        self._structure_cache = functools.lru_cache(maxsize=256)(self.library.browse_hex_structure)
+        self._stats_cache = {}
+
+        # Statistics window, created on first use
+        self._stats_window = None
+        self._stats_text = None
+        self._stats_shown = None
+
+        # Shared results window, created on first use
+        self._results_window = None
+        self._results_text = None
+        self._results_content = ""
+
+        # Hex browser window state, created on first use
+        self._browser = None
+        self._browser_level = None
+        self._browser_items = []
+        self._browser_selection = None
+        self._nav_stack = []
 
         # Step 5: Create widgets and show welcome
         self.create_widgets()
@@ -462,6 +602,12 @@ class LibraryOfBabelGUI:
             col = i % 2
             btn.grid(row=row, column=col, padx=10, pady=10)
 
+    def _clear_view_caches(self):
+        """Drop memoized pages, structure listings and statistics after the charset or seed changes."""
+        self._cached_page.cache_clear()
+        self._structure_cache.cache_clear()
+        self._stats_cache.clear()
+
     def _get_config_text(self):
         """Get current configuration text for display."""
         charset_size = len(self.library.CHARSET)
@@ -471,6 +617,7 @@ class LibraryOfBabelGUI:
         """Toggle number inclusion with user feedback."""
         try:
             self.library.set_include_numbers(self.include_numbers.get())
+            self._clear_view_caches()
             self.config_label.config(text=self._get_config_text())
 
             mode = "with numbers" if self.include_numbers.get() else "letters only"
@@ -502,6 +649,7 @@ class LibraryOfBabelGUI:
                         raise ValueError("Seed too short (minimum 32 characters)")
 
                     self.library.set_seed(new_seed.strip())
+                    self._clear_view_caches()
                     self.config_label.config(text=self._get_config_text())
                     messagebox.showinfo("Seed Updated",
                                         f"Cryptographic seed updated\n"
@@ -510,6 +658,7 @@ class LibraryOfBabelGUI:
                     # Reset to default
                     default_seed = "8e447372cbc75ffc238749baf6eccbec586104336af37347606d14c698eaec1f"
                     self.library.set_seed(default_seed)
+                    self._clear_view_caches()
                     self.config_label.config(text=self._get_config_text())
                     messagebox.showinfo("Seed Reset", "Seed reset to default value")
 
@@ -554,71 +703,86 @@ class LibraryOfBabelGUI:
 
     def create_results_window(self, title, results, is_search=False):
         """Create enhanced results window with improved formatting."""
-        window = tk.Toplevel(self.root)
-        window.title(title)
-        window.geometry("1400x1000")
-        window.configure(bg=self.bg_color)
-
-        # Main content frame
-        main_frame = tk.Frame(window, bg=self.bg_color)
-        main_frame.pack(fill='both', expand=True, padx=15, pady=15)
-
-        # Text display
-        text_widget = ScrolledText(
-            main_frame,
-            font=("Courier", 13),
-            bg=self.button_bg,
-            fg=self.fg_color,
-            insertbackground=self.fg_color,
-            selectbackground=self.highlight_color,
-            selectforeground='black',
-            wrap=tk.WORD,
-            state='normal'
-        )
-        text_widget.pack(fill='both', expand=True)
-
         # Format search results with enhanced display
         if is_search and isinstance(results, list):
-            content = f"🔍 SEARCH RESULTS: '{results[0]['search_text']}'\n"
-            content += "_" * 120 + "\n\n"
+            parts = [f"🔍 SEARCH RESULTS: '{results[0]['search_text']}'\n"]
+            parts.append(_SEP_RESULTS)
 
             # Group by match type
             exact_matches = [r for r in results if r['type'] == 'exact']
             similar_matches = [r for r in results if r['type'] == 'similar']
 
             if exact_matches:
-                content += f" PERFECT MATCHES ({len(exact_matches)})\n"
-                content += "Full searched text preserved exactly\n"
-                content += "_" * 120 + "\n\n"
+                parts.append(f" PERFECT MATCHES ({len(exact_matches)})\n")
+                parts.append("Full searched text preserved exactly\n")
+                parts.append(_SEP_RESULTS)
                 for i, res in enumerate(exact_matches, 1):
-                    content += f"Match {i}:\n"
-                    content += f"Address: {res['address']}\n"
-                    content += " " * 120 + "\n\n"
-                    content += f"Preview: {res['content'][:180]}...\n\n"
+                    parts.append(f"Match {i}:\n")
+                    parts.append(f"Address: {res['address']}\n")
+                    parts.append(_SEP_RESULTS_BLANK)
+                    parts.append(f"Preview: {res['content'][:180]}...\n\n")
 
             if similar_matches:
-                content += f" ORGANIC MATCHES ({len(similar_matches)})\n"
-                content += "Text found as natural substring within generated pages\n"
-                content += "_" * 120 + "\n\n"
+                parts.append(f" ORGANIC MATCHES ({len(similar_matches)})\n")
+                parts.append("Text found as natural substring within generated pages\n")
+                parts.append(_SEP_RESULTS)
                 for i, res in enumerate(similar_matches, 1):
-                    content += f"Match {i}:\n"
-                    content += f"Address: {res['address']}\n"
-                    content += f"Position: {res['position']}\n"
+                    parts.append(f"Match {i}:\n")
+                    parts.append(f"Address: {res['address']}\n")
+                    parts.append(f"Position: {res['position']}\n")
                     start_pos = max(0, res['position'] - 30)
                     end_pos = min(len(res['content']), res['position'] + len(res['search_text']) + 30)
                     context = res['content'][start_pos:end_pos]
-                    content += "_" * 120 + "\n\n"
-                    content += f"Context: ...{context}...\n\n"
+                    parts.append(_SEP_RESULTS)
+                    parts.append(f"Context: ...{context}...\n\n")
 
             # Add statistics
-            content += "\n" + "=" * 120 + "\n"
-            content += f"Search completed successfully\n"
-            content += f"Character set: {len(self.library.CHARSET)} symbols\n"
-            content += f"Cache entries: {self.library.get_cache_stats()['content_cache_size']}\n"
+            parts.append(_SEP_RESULTS_END)
+            parts.append(f"Search completed successfully\n")
+            parts.append(f"Character set: {len(self.library.CHARSET)} symbols\n")
+            parts.append(f"Cache entries: {self.library.get_cache_stats()['content_cache_size']}\n")
+            content = ''.join(parts)
         else:
             content = results
 
+        # One results window is reused; it is hidden rather than destroyed when closed
+        if self._results_window is None or not self._results_window.winfo_exists():
+            self._create_results_window()
+
+        window = self._results_window
+        self._results_content = content
+        text_widget = self._results_text
+        text_widget.delete('1.0', 'end')
         text_widget.insert('1.0', content)
+        text_widget.see('1.0')
+
+        window.title(title)
+        window.deiconify()
+        window.lift()
+
+    def _create_results_window(self):
+        """Build the shared results window and its widgets once."""
+        window = tk.Toplevel(self.root)
+        window.geometry("1400x1000")
+        window.configure(bg=self.bg_color)
+
+        # Main content frame
+        main_frame = tk.Frame(window, bg=self.bg_color)
+        main_frame.pack(fill='both', expand=True, padx=15, pady=15)
+
+        # Text display
+        text_widget = ScrolledText(
+            main_frame,
+            font=("Courier", 13),
+            bg=self.button_bg,
+            fg=self.fg_color,
+            insertbackground=self.fg_color,
+            selectbackground=self.highlight_color,
+            selectforeground='black',
+            wrap=tk.WORD,
+            state='normal'
+        )
+        text_widget.pack(fill='both', expand=True)
 
         # Control buttons
         button_frame = tk.Frame(window, bg=self.bg_color)
@@ -627,7 +791,7 @@ class LibraryOfBabelGUI:
         copy_btn = tk.Button(
             button_frame,
             text="Copy All Text",
-            command=lambda: self.copy_to_clipboard(content),
+            command=lambda: self.copy_to_clipboard(self._results_content),
             font=("Arial", 11, "bold"),
             bg=self.highlight_color,
             fg='black',
@@ -658,6 +822,11 @@ class LibraryOfBabelGUI:
         )
         copy_selected_btn.pack(side='left', padx=5)
 
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+
+        self._results_window = window
+        self._results_text = text_widget
+
     def search_text(self):
         """Enhanced text search with comprehensive error handling."""
         search_term = simpledialog.askstring(
@@ -723,35 +892,43 @@ class LibraryOfBabelGUI:
 
     def browse_address(self):
         """Browse specific address with enhanced validation."""
+        lib = self.library
         address = simpledialog.askstring(
             "Browse Library Address",
             "Enter complete address:\n\n"
             "Format: [hex]-w[wall]-s[shelf]-v[volume]:[page]\n"
             "Example: abc123...-w1-s5-v12:200\n\n"
             f"Valid ranges:\n"
-            f"• Walls: 1-{self.library.WALLS_PER_HEX}\n"
-            f"• Shelves: 1-{self.library.SHELVES_PER_WALL}\n"
-            f"• Volumes: 1-{self.library.VOLUMES_PER_SHELF}\n"
-            f"• Pages: 1-{self.library.PAGES_PER_VOLUME}",
+            f"• Walls: 1-{lib.WALLS_PER_HEX}\n"
+            f"• Shelves: 1-{lib.SHELVES_PER_WALL}\n"
+            f"• Volumes: 1-{lib.VOLUMES_PER_SHELF}\n"
+            f"• Pages: 1-{lib.PAGES_PER_VOLUME}",
             parent=self.root
         )
 
+        address = (address or "").strip()
         if not address:
             return
 
         try:
-            # Validate address format
-            hex_name, wall, shelf, volume, page = self.library.parse_address(address)
-            content = self.library.generate_page_from_address(address)
-
-            result_text = f"📖 PAGE CONTENT\n"
-            result_text += "=" * 80 + "\n\n"
-            result_text += f"Address: {address}\n"
-            result_text += f"Location: Hex {hex_name[:20]}... → Wall {wall} → Shelf {shelf} → Volume {volume} → Page {page}\n"
-            result_text += f"Character Set: {len(self.library.CHARSET)} symbols\n\n"
-            result_text += "Content:\n"
-            result_text += "-" * 40 + "\n"
-            result_text += content
+            # Reject malformed input with one regex match before the library parses it
+            if not _ADDR_RE.match(address):
+                raise ValueError("Malformed address: expected [hex]-w[wall]-s[shelf]-v[volume]:[page]")
+            hex_name, wall, shelf, volume, page = lib.parse_address(address)
+            content = self._cached_page(hex_name, wall, shelf, volume, page)
+
+            result_text = "\n".join([
+                "📖 PAGE CONTENT",
+                _SEP_EQ,
+                "",
+                f"Address: {address}",
+                f"Location: Hex {hex_name[:20]}... → Wall {wall} → Shelf {shelf} → Volume {volume} → Page {page}",
+                f"Character Set: {len(lib.CHARSET)} symbols",
+                "",
+                "Content:",
+                _SEP_DASH,
+                content
+            ])
 
             self.create_results_window(f"Page: {address}", result_text)
 
@@ -776,7 +953,7 @@ class LibraryOfBabelGUI:
             return
 
         if not hex_name:
-            hex_name = self.library._generate_hex_name(str(random.random()), 0)
+            hex_name = self.library._generate_hex_name(secrets.token_hex(16), 0)
             messagebox.showinfo(
                 "Random Hex Generated",
                 f"Exploring random hex:\n{hex_name[:40]}...\n\n"
@@ -787,105 +964,198 @@ class LibraryOfBabelGUI:
 
     def show_hex_browser(self, hex_name, wall=None, shelf=None, volume=None):
         """Display enhanced hex browser with improved navigation."""
+        # A single browser window is reused for every level; opening a new hex resets
+        # its Back history
+        if self._browser is None or not self._browser.winfo_exists():
+            self._create_hex_browser()
+        else:
+            self._browser.deiconify()
+            self._browser.lift()
+
+        self._nav_stack = []
+        self._browser_level = None
+        self._navigate_hex_browser((hex_name, wall, shelf, volume))
+
+    def _create_hex_browser(self):
+        """Build the hex browser window and its widgets once."""
         browser = tk.Toplevel(self.root)
-        browser.title(f"Hex Explorer: {hex_name[:30]}...")
         browser.geometry("1000x800")
         browser.configure(bg=self.bg_color)
 
-        # Navigation breadcrumb
-        nav_parts = [f"Hex: {hex_name[:20]}..."]
-        if wall: nav_parts.append(f"Wall {wall}")
-        if shelf: nav_parts.append(f"Shelf {shelf}")
-        if volume: nav_parts.append(f"Volume {volume}")
+        # Navigation breadcrumb and Back button
+        nav_frame = tk.Frame(browser, bg=self.bg_color)
+        nav_frame.pack(fill='x', padx=20, pady=15)
+
+        back_btn = tk.Button(
+            nav_frame,
+            text="← Back",
+            command=self._hex_browser_back,
+            font=("Arial", 11, "bold"),
+            bg=self.button_bg,
+            fg=self.button_fg,
+            activebackground=self.button_active_bg,
+            state='disabled'
+        )
+        back_btn.pack(side='left')
 
         nav_label = tk.Label(
-            browser,
-            text=" → ".join(nav_parts),
+            nav_frame,
             font=("Arial", 14, "bold"),
             bg=self.bg_color,
             fg=self.highlight_color,
-            wraplength=950
+            wraplength=850
         )
-        nav_label.pack(pady=15)
+        nav_label.pack(side='left', expand=True)
 
-        try:
-            items = self.library.browse_hex_structure(hex_name, wall, shelf, volume)
+        # Create browsing interface
+        list_frame = tk.Frame(browser, bg=self.bg_color)
+        list_frame.pack(fill='both', expand=True, padx=20, pady=10)
 
-            # Create browsing interface
-            list_frame = tk.Frame(browser, bg=self.bg_color)
-            list_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        scrollbar = tk.Scrollbar(list_frame)
+        scrollbar.pack(side='right', fill='y')
 
-            scrollbar = tk.Scrollbar(list_frame)
-            scrollbar.pack(side='right', fill='y')
+        listbox = tk.Listbox(
+            list_frame,
+            font=("Courier", 13),
+            bg=self.button_bg,
+            fg=self.fg_color,
+            yscrollcommand=scrollbar.set,
+            selectbackground=self.highlight_color,
+            selectforeground='black'
+        )
+        listbox.pack(side='left', fill='both', expand=True)
+        scrollbar.config(command=listbox.yview)
 
-            listbox = tk.Listbox(
-                list_frame,
-                font=("Courier", 13),
-                bg=self.button_bg,
-                fg=self.fg_color,
-                yscrollcommand=scrollbar.set,
-                selectbackground=self.highlight_color,
-                selectforeground='black'
-            )
-            listbox.pack(side='left', fill='both', expand=True)
-            scrollbar.config(command=listbox.yview)
-
-            # Populate list with items
-            for item in items:
-                display_text = f"{item['identifier']}: {item['preview'][:70]}{'...' if len(item['preview']) > 70 else ''}"
-                listbox.insert('end', display_text)
-
-            # Handle navigation
-            def on_select(event):
-                selection = listbox.curselection()
-                if selection:
-                    item = items[selection[0]]
-                    try:
-                        if item['type'] == 'wall':
-                            wall_num = int(item['identifier'].split()[1])
-                            self.show_hex_browser(hex_name, wall_num)
-                        elif item['type'] == 'shelf':
-                            shelf_num = int(item['identifier'].split()[1])
-                            self.show_hex_browser(hex_name, wall, shelf_num)
-                        elif item['type'] == 'volume':
-                            volume_num = int(item['identifier'].split()[1])
-                            self.show_hex_browser(hex_name, wall, shelf, volume_num)
-                        elif item['type'] == 'page':
-                            content = self.library.generate_page_from_address(item['address'])
-                            self.create_results_window(f"Page: {item['address']}", content)
-                    except Exception as e:
-                        messagebox.showerror("Navigation Error", f"Failed to navigate: {str(e)}")
-
-            listbox.bind('<Double-1>', on_select)
-
-            # Instructions
-            instruction_label = tk.Label(
-                browser,
-                text="Double-click any item to navigate deeper or view page content",
-                font=("Arial", 10),
-                bg=self.bg_color,
-                fg=self.fg_color
-            )
-            instruction_label.pack(pady=5)
+        # Preview pane, filled in on demand for the selected row
+        preview_label = tk.Label(
+            browser,
+            font=("Courier", 11),
+            bg=self.bg_color,
+            fg=self.fg_color,
+            justify='left',
+            anchor='w',
+            wraplength=950
+        )
+        preview_label.pack(fill='x', padx=20, pady=5)
+
+        # The selected row is tracked here on <<ListboxSelect>>, which fires before
+        # <Double-1>, so navigation does not query the listbox again
+        def on_highlight(event):
+            selection = listbox.curselection()
+            self._browser_selection = selection[0] if selection else None
+            if selection:
+                item = self._browser_items[selection[0]]
+                try:
+                    # Preview only the opening text so highlighting rows never fills the
+                    # page caches with pages that are not opened
+                    content = self.library._generate_preview(item['address'], 300)
+                    preview_label.config(text=f"{item['identifier']}:\n{content}...")
+                except Exception as e:
+                    preview_label.config(text=f"Preview unavailable: {str(e)}")
+
+        # Handle navigation
+        def on_select(event):
+            if self._browser_selection is not None:
+                item = self._browser_items[self._browser_selection]
+                hex_name, wall, shelf, volume = self._browser_level
+                try:
+                    if item['type'] == 'wall':
+                        wall_num = int(item['identifier'].split()[1])
+                        self._navigate_hex_browser((hex_name, wall_num, None, None))
+                    elif item['type'] == 'shelf':
+                        shelf_num = int(item['identifier'].split()[1])
+                        self._navigate_hex_browser((hex_name, wall, shelf_num, None))
+                    elif item['type'] == 'volume':
+                        volume_num = int(item['identifier'].split()[1])
+                        self._navigate_hex_browser((hex_name, wall, shelf, volume_num))
+                    elif item['type'] == 'page':
+                        content = self._cached_page(*item['location'])
+                        self.create_results_window(f"Page: {item['address']}", content)
+                except Exception as e:
+                    messagebox.showerror("Navigation Error", f"Failed to navigate: {str(e)}")
+
+        listbox.bind('<<ListboxSelect>>', on_highlight)
+        listbox.bind('<Double-1>', on_select)
+
+        # Instructions
+        instruction_label = tk.Label(
+            browser,
+            text="Double-click any item to navigate deeper or view page content",
+            font=("Arial", 10),
+            bg=self.bg_color,
+            fg=self.fg_color
+        )
+        instruction_label.pack(pady=5)
+
+        self._browser = browser
+        self._browser_nav_label = nav_label
+        self._browser_back_btn = back_btn
+        self._browser_listbox = listbox
+        self._browser_preview_label = preview_label
+
+    def _navigate_hex_browser(self, level, push=True):
+        """Repopulate the hex browser in place for a (hex_name, wall, shelf, volume) level."""
+        hex_name, wall, shelf, volume = level
 
+        try:
+            # List identifiers only; a preview is generated when a row is selected
+            items = self._structure_cache(hex_name, wall, shelf, volume, False)
         except Exception as e:
             messagebox.showerror("Browser Error", f"Failed to browse structure: {str(e)}")
+            return
+
+        if push and self._browser_level is not None:
+            self._nav_stack.append(self._browser_level)
+        self._browser_level = level
+        self._browser_items = items
+        self._browser_selection = None
+
+        # Navigation breadcrumb
+        hex_short = hex_name[:30]
+        nav_parts = [f"Hex: {hex_short[:20]}..."]
+        if wall: nav_parts.append(f"Wall {wall}")
+        if shelf: nav_parts.append(f"Shelf {shelf}")
+        if volume: nav_parts.append(f"Volume {volume}")
+
+        self._browser.title(f"Hex Explorer: {hex_short}...")
+        self._browser_nav_label.config(text=" → ".join(nav_parts))
+        self._browser_back_btn.config(state='normal' if self._nav_stack else 'disabled')
+        self._browser_preview_label.config(text="Select an item to preview its first page")
+
+        # Populate list with items in a single Tcl call
+        display_texts = [item['identifier'] for item in items]
+
+        listbox = self._browser_listbox
+        listbox.delete(0, 'end')
+        listbox.insert('end', *display_texts)
+        listbox.yview_moveto(0)
+
+    def _hex_browser_back(self):
+        """Return the hex browser to the previous level."""
+        if self._nav_stack:
+            self._navigate_hex_browser(self._nav_stack.pop(), push=False)
 
     def random_page(self):
         """Generate and display random page with enhanced information."""
+        lib = self.library
+
         try:
-            page_data = self.library.generate_random_page()
-
-            result_text = f"🎲 RANDOM PAGE\n"
-            result_text += "=" * 80 + "\n\n"
-            result_text += f"Address: {page_data['address']}\n"
-            result_text += f"Coordinates: Wall {page_data['wall']}, Shelf {page_data['shelf']}, "
-            result_text += f"Volume {page_data['volume']}, Page {page_data['page']}\n"
-            result_text += f"Character Set: {len(self.library.CHARSET)} symbols\n"
-            result_text += f"Hex Length: {self.library.HEX_LENGTH} characters\n\n"
-            result_text += "Content:\n"
-            result_text += "-" * 40 + "\n"
-            result_text += page_data['content']
+            page_data = lib.generate_random_page()
+
+            result_text = "\n".join([
+                "🎲 RANDOM PAGE",
+                _SEP_EQ,
+                "",
+                f"Address: {page_data['address']}",
+                f"Coordinates: Wall {page_data['wall']}, Shelf {page_data['shelf']}, "
+                f"Volume {page_data['volume']}, Page {page_data['page']}",
+                f"Character Set: {len(lib.CHARSET)} symbols",
+                f"Hex Length: {lib.HEX_LENGTH} characters",
+                "",
+                "Content:",
+                _SEP_DASH,
+                page_data['content']
+            ])
 
             self.create_results_window("Random Page", result_text)
 
@@ -898,53 +1168,104 @@ class LibraryOfBabelGUI:
     def show_statistics(self):
         """Display comprehensive statistics with current improvements."""
         try:
-            cache_stats = self.library.get_cache_stats()
+            # The text only depends on the charset, so build it once per mode
+            stats_text = self._stats_cache.get(self.library.include_numbers)
+            if stats_text is None:
+                stats_text = self._build_statistics_text()
+                self._stats_cache[self.library.include_numbers] = stats_text
+
+            # Shown in a reusable scrollable window rather than a message box
+            if self._stats_window is None or not self._stats_window.winfo_exists():
+                self._create_stats_window()
+            if self._stats_shown is not stats_text:
+                self._stats_text.config(state='normal')
+                self._stats_text.delete('1.0', 'end')
+                self._stats_text.insert('1.0', stats_text)
+                self._stats_text.config(state='disabled')
+                self._stats_shown = stats_text
+
+            self._stats_window.deiconify()
+            self._stats_window.lift()
+
+        except Exception as e:
+            messagebox.showerror("Statistics Error", f"Failed to generate statistics: {str(e)}")
+
+    def _create_stats_window(self):
+        """Build the statistics window once; closing it only hides it."""
+        window = tk.Toplevel(self.root)
+        window.title("Enhanced Library Statistics")
+        window.geometry("800x750")
+        window.configure(bg=self.bg_color)
+
+        text_widget = ScrolledText(
+            window,
+            font=("Courier", 12),
+            bg=self.button_bg,
+            fg=self.fg_color,
+            selectbackground=self.highlight_color,
+            selectforeground='black',
+            wrap=tk.WORD
+        )
+        text_widget.pack(fill='both', expand=True, padx=15, pady=15)
+
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+
+        self._stats_window = window
+        self._stats_text = text_widget
+        self._stats_shown = None
+
+    def _build_statistics_text(self):
+        """Assemble the statistics report for the current configuration."""
+        lib = self.library
+        charset = lib.CHARSET
+        page_length = lib.PAGE_LENGTH
+        hex_length = lib.HEX_LENGTH
+        include_numbers = lib.include_numbers
 
-            # Calculate theoretical values
-            current_charset = len(self.library.CHARSET)
-            alt_charset = 39 if current_charset == 29 else 29
-            alt_hex_length = self.library._calculate_required_hex_length(alt_charset)
+        # Calculate theoretical values
+        current_charset = len(charset)
+        alt_charset = 39 if current_charset == 29 else 29
+        alt_hex_length = lib._calculate_required_hex_length(alt_charset)
 
-            # Calculate total possible pages
-            log10_pages = self.library.PAGE_LENGTH * math.log10(current_charset)
-            pages_exponent = int(log10_pages)
+        # Calculate total possible pages
+        log10_charset = _LOG10_CHARSET.get(current_charset)
+        if log10_charset is None:
+            log10_charset = math.log10(current_charset)
+        log10_pages = page_length * log10_charset
+        pages_exponent = int(log10_pages)
 
-            stats_text = f"""📊 ENHANCED LIBRARY STATISTICS
+        stats_text = f"""📊 ENHANCED LIBRARY STATISTICS
 
 Current Configuration:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━
-• Character Set: {current_charset} symbols ({'with' if self.library.include_numbers else 'without'} numbers)
-• Supported Characters: {self.library.CHARSET}
-• Page Length: {self.library.PAGE_LENGTH:,} characters
-• Hex Name Length: {self.library.HEX_LENGTH:,} characters (mathematically exact)
+• Character Set: {current_charset} symbols ({'with' if include_numbers else 'without'} numbers)
+• Supported Characters: {charset}
+• Page Length: {page_length:,} characters
+• Hex Name Length: {hex_length:,} characters (mathematically exact)
 
 Library Structure:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━
-• Walls per Hex: {self.library.WALLS_PER_HEX}
-• Shelves per Wall: {self.library.SHELVES_PER_WALL} 
-• Volumes per Shelf: {self.library.VOLUMES_PER_SHELF}
-• Pages per Volume: {self.library.PAGES_PER_VOLUME}
-• Total Pages per Hex: {self.library.WALLS_PER_HEX * self.library.SHELVES_PER_WALL * self.library.VOLUMES_PER_SHELF * self.library.PAGES_PER_VOLUME:,}
+• Walls per Hex: {lib.WALLS_PER_HEX}
+• Shelves per Wall: {lib.SHELVES_PER_WALL} 
+• Volumes per Shelf: {lib.VOLUMES_PER_SHELF}
+• Pages per Volume: {lib.PAGES_PER_VOLUME}
+• Total Pages per Hex: {lib.WALLS_PER_HEX * lib.SHELVES_PER_WALL * lib.VOLUMES_PER_SHELF * lib.PAGES_PER_VOLUME:,}
 
 Alternative Configuration:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━
-• {alt_charset} characters ({'with' if not self.library.include_numbers else 'without'} numbers)
+• {alt_charset} characters ({'with' if not include_numbers else 'without'} numbers)
 • Required Hex Length: {alt_hex_length:,} characters
-• Length Difference: {abs(alt_hex_length - self.library.HEX_LENGTH):,} characters
+• Length Difference: {abs(alt_hex_length - hex_length):,} characters
 
 Cosmic Scale:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━
-• Total Possible Pages: {current_charset}^{self.library.PAGE_LENGTH} ≈ 10^{pages_exponent:,}
+• Total Possible Pages: {current_charset}^{page_length} ≈ 10^{pages_exponent:,}
 • Atoms in Observable Universe: ~10^80
 • Ratio: ~10^{pages_exponent - 80:,} times larger than atomic scale
 • Required Hexes: ~10^{pages_exponent - 5:,}
 
 """
-
-            messagebox.showinfo("Enhanced Library Statistics", stats_text)
-
-        except Exception as e:
-            messagebox.showerror("Statistics Error", f"Failed to generate statistics: {str(e)}")
+        return stats_text
 
     def run(self):
         """Start the enhanced Library of Babel application."""